@@ -14,6 +14,19 @@ You'll edit this file in Task 2.
 """
 import csv
 import json
+import mmap
+import os
+from operator import itemgetter
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from models import NearEarthObject, CloseApproach
 
@@ -24,27 +37,124 @@ def load_neos(neo_csv_path):
     :param neo_csv_path: A path to a CSV file containing data about near-Earth objects.
     :return: A collection of `NearEarthObject`s.
     """
-    neos = []
-    with open(neo_csv_path, 'r') as f:
-        reader = csv.DictReader(f)  # use dictreader to avoid number-based indexing
+    with open(neo_csv_path, 'r', newline='') as f:
+        reader = csv.reader(f)
+        # look the columns up by name in the header, so rows can stay plain lists instead of a dict each
+        header = next(reader)
+        columns = itemgetter(*(header.index(field) for field in ('pdes', 'name', 'diameter', 'pha')))
         # create neos
-        for row in reader:
-            neos.append(NearEarthObject(row['pdes'], row['name'], row['diameter'], row['pha']))
+        neos = [NearEarthObject(*columns(row)) for row in reader]
 
     return neos
 
 
-def load_approaches(cad_json_path):
+def load_approaches(cad_json_path, cache=False):
     """Read close approach data from a JSON file.
 
+    If `cache` is set, the extracted fields are saved, column by column, as a
+    smaller JSON file next to the original. They're reused instead of parsing
+    the original again for as long as its modification time and size match.
+
     :param cad_json_path: A path to a JSON file containing data about close approaches.
+    :param cache: Whether to read and write a cached copy of the extracted data.
     :return: A collection of `CloseApproach`es.
     """
-    cas = []
-    with open(cad_json_path, 'r') as f:
-        contents = json.load(f)
+    cache_path = f"{cad_json_path}.cache"
+    records = _read_cached_records(cad_json_path, cache_path) if cache else None
+    if records is None:
+        source = _source_signature(cad_json_path)  # taken before parsing, so a concurrent change is never hidden
+        records = _extract_approach_records(cad_json_path)
+        if cache:
+            _write_cached_records(cache_path, source, records)
 
-    for row in contents['data']:  # 'data' key is list of records, each record is a list
-        cas.append(CloseApproach(time=row[3], distance=row[4], velocity=row[7], _designation=row[0]))
+    # built serially on purpose: handing the objects (or even the records) back from worker processes costs
+    # several times more in pickling than constructing them here does
+    cas = [CloseApproach(*record) for record in records]
 
     return cas
+
+
+def _extract_approach_records(cad_json_path):
+    """Parse a close approach JSON file into the fields needed to build `CloseApproach`es.
+
+    :param cad_json_path: A path to a JSON file containing data about close approaches.
+    :return: A list of (calendar date, distance, velocity, designation) tuples.
+    """
+    # map the file rather than reading it into a bytes object, so the parsers work directly on the page cache
+    with open(cad_json_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as raw:
+        # prefer simdjson, which parses lazily so only the fields we index are converted to Python objects,
+        # then orjson, and fall back to json if neither is installed
+        if simdjson:
+            parser = simdjson.Parser()  # keep a reference: the parsed document is only valid while its parser lives
+            contents = parser.parse(raw)  # the parser copies the input, so the document outlives the mapping
+        elif orjson:
+            contents = orjson.loads(memoryview(raw))
+        else:
+            contents = json.loads(raw[:])
+
+    # 'fields' names the entries of each record, so look up the columns we need once, in constructor order
+    fields = list(contents['fields'])
+    getter = itemgetter(*(fields.index(field) for field in ('cd', 'dist', 'v_rel', 'des')))
+    # 'data' key is list of records, each record is a list
+    return list(map(getter, contents['data']))
+
+
+def _source_signature(cad_json_path):
+    """Identify the current contents of a file by its modification time (in ns) and size.
+
+    :param cad_json_path: A path to a JSON file containing data about close approaches.
+    :return: A `[st_mtime_ns, st_size]` list, as stored in the cache.
+    """
+    stat = os.stat(cad_json_path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _read_cached_records(cad_json_path, cache_path):
+    """Load previously extracted close approach records, if a cache of the JSON file's current contents exists.
+
+    The cache is only used if the source signature it was written for matches
+    the JSON file exactly - a replaced file with an older modification time is
+    still noticed. Any cache that can't be read or doesn't hold the expected
+    records is ignored, so the JSON file is parsed again.
+
+    :param cad_json_path: A path to a JSON file containing data about close approaches.
+    :param cache_path: A path to the cached columns extracted from that file.
+    :return: An iterable of the cached records, or None if there is no usable cache.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            raw = f.read()
+        cached = orjson.loads(raw) if orjson else json.loads(raw)
+        if cached['source'] != _source_signature(cad_json_path):
+            return None
+        columns = cached['columns']
+    except (OSError, ValueError, TypeError, KeyError):  # missing, unreadable or malformed cache
+        return None
+
+    # there must be four equally long columns of the strings `_extract_approach_records` produces
+    valid = (type(columns) is list and len(columns) == 4
+             and all(type(column) is list and set(map(type, column)) <= {str} for column in columns)
+             and len(set(map(len, columns))) == 1)
+    return zip(*columns) if valid else None
+
+
+def _write_cached_records(cache_path, source, records):
+    """Save extracted close approach records as JSON for reuse by later runs.
+
+    The records are stored as four columns rather than one list per record,
+    which makes the cache several times faster to load. Failing to write the
+    cache (e.g. in a read-only directory) isn't an error.
+
+    :param cache_path: A path at which to save the cached records.
+    :param source: The signature of the JSON file the records were extracted from.
+    :param records: The records returned by `_extract_approach_records`.
+    """
+    columns = [list(column) for column in zip(*records)] or [[], [], [], []]
+    cached = {'source': source, 'columns': columns}
+    temp_path = f"{cache_path}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(orjson.dumps(cached) if orjson else json.dumps(cached).encode())
+        os.replace(temp_path, cache_path)  # so a concurrent run never reads a half-written cache
+    except OSError:
+        pass
@@ -13,6 +13,11 @@ provide that level of resolution, so the output format also will not.
 import datetime
 
 
+# English month abbreviations, as used by the `cd` field of NASA's close approach data.
+_MONTHS = {'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+           'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12}
+
+
 def cd_to_datetime(calendar_date):
     """Convert a NASA-formatted calendar date/time description into a datetime.
 
@@ -23,9 +28,23 @@ def cd_to_datetime(calendar_date):
 
     This will become the Python object `datetime.datetime(2020, 12, 31, 12, 0)`.
 
+    Since the format is fixed, the fields of input with exactly that layout are
+    sliced out directly - this is several times faster than `strptime`, which
+    handles (and rejects) anything else.
+
     :param calendar_date: A calendar date in YYYY-bb-DD hh:mm format.
     :return: A naive `datetime` corresponding to the given calendar date and time.
     """
+    if (len(calendar_date) == 17 and calendar_date[4] == '-' and calendar_date[8] == '-'
+            and calendar_date[11] == ' ' and calendar_date[14] == ':'):
+        # int() also accepts whitespace, signs and underscores, so check the numeric fields are only digits
+        year, day, hour, minute = calendar_date[0:4], calendar_date[9:11], calendar_date[12:14], calendar_date[15:17]
+        month = _MONTHS.get(calendar_date[5:8])
+        if month and year.isdecimal() and day.isdecimal() and hour.isdecimal() and minute.isdecimal():
+            try:
+                return datetime.datetime(int(year), month, int(day), int(hour), int(minute))
+            except ValueError:  # out of range, e.g. Feb 30th
+                pass
     return datetime.datetime.strptime(calendar_date, "%Y-%b-%d %H:%M")
 
 
@@ -43,12 +62,3 @@ def datetime_to_str(dt):
     """
     return datetime.datetime.strftime(dt, "%Y-%m-%d %H:%M")
 
-
-def parse_y_n_bool(value: str):
-    """
-    Parse 'Y' as True and 'N' as False.
-
-    :param value: Y or N
-    :returns bool: True if Y and False if N
-    """
-    return True if value == "Y" else False
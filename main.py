@@ -34,7 +34,8 @@ command shell that can repeatedly execute `inspect` and `query` commands without
 having to wait to reload the database each time. However, it doesn't hot-reload.
 
 If needed, the script can load data from data files other than the default with
-`--neofile` or `--cadfile`.
+`--neofile` or `--cadfile`. The close approaches extracted from the JSON file
+are cached next to it to speed up later runs; pass `--no-cache` to disable this.
 """
 import argparse
 import cmd
@@ -89,6 +90,8 @@ def make_parser():
     parser.add_argument('--cadfile', default=(DATA_ROOT / 'cad.json'),
                         type=pathlib.Path,
                         help="Path to JSON file of close approach data.")
+    parser.add_argument('--no-cache', dest='cache', action='store_false',
+                        help="Don't read or write a cached copy of the close approach data next to the JSON file.")
     subparsers = parser.add_subparsers(dest='cmd')
 
     # Add the `inspect` subcommand parser.
@@ -383,7 +386,7 @@ def main():
     args = parser.parse_args()
 
     # Extract data from the data files into structured Python objects.
-    database = NEODatabase(load_neos(args.neofile), load_approaches(args.cadfile))
+    database = NEODatabase(load_neos(args.neofile), load_approaches(args.cadfile, cache=args.cache))
 
     # Run the chosen subcommand.
     if args.cmd == 'inspect':
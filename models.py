@@ -17,8 +17,12 @@ quirks of the data set, such as missing names and unknown diameters.
 
 You'll edit this file in Task 1.
 """
-from helpers import cd_to_datetime, datetime_to_str, parse_y_n_bool
+from helpers import cd_to_datetime, datetime_to_str
 from datetime import datetime
+import sys
+
+# The special cases of NASA's pha flag: 'Y' is hazardous and a missing flag stays unknown. Any other value is not.
+_PHA_MAP = {'Y': True, None: None}
 
 
 class NearEarthObject:
@@ -32,9 +36,13 @@ class NearEarthObject:
     A `NearEarthObject` also maintains a collection of its close approaches -
     initialized to an empty collection, but eventually populated in the
     `NEODatabase` constructor.
+
+    Like `CloseApproach`, instances store their attributes in `__slots__`.
     """
 
-    def __init__(self, designation: str, name: str = None, diameter: float = float('nan'), hazardous: str = None, approaches: list = [], **info):
+    __slots__ = ('designation', 'name', 'diameter', 'hazardous', 'approaches')
+
+    def __init__(self, designation: str, name: str = None, diameter: float = float('nan'), hazardous: str = None, approaches: list = None):
         """Create a new `NearEarthObject`.
 
         :param designation:     The NEO's primary designation (pdes) e.g. 433
@@ -42,15 +50,14 @@ class NearEarthObject:
         :param diameter:        The NEO's diameter in km
         :param hazardous:       Whether the NEO was potentially hazardous (pha)
         :param approaches:      A list of the NEO's approaches
-        :param info:            A dictionary of excess keyword arguments supplied to the constructor.
         """
-        self.designation = str(designation)
+        self.designation = sys.intern(str(designation))  # shared with the matching approaches' designations
         self.name = name if name else None
         self.diameter = float('nan') if diameter == '' else float(diameter)
-        self.hazardous = parse_y_n_bool(hazardous) if hazardous is not None else None  # there are also some missing values here
+        self.hazardous = _PHA_MAP.get(hazardous, False)  # a dict lookup avoids a function call per NEO
 
-        # Create an empty initial collection of linked approaches.
-        self.approaches = approaches
+        # Create an empty initial collection of linked approaches, unless some were supplied.
+        self.approaches = [] if approaches is None else approaches
 
     @property
     def fullname(self):
@@ -94,25 +101,39 @@ class CloseApproach:
     initially, this information (the NEO's primary designation) is saved in a
     private attribute, but the referenced NEO is eventually replaced in the
     `NEODatabase` constructor.
+
+    The data set holds hundreds of thousands of close approaches, so instances
+    store their attributes in `__slots__` rather than a per-instance `__dict__`.
+    Most of them never survive a query's filters, so the approach time is kept
+    as NASA's calendar date string until it's first accessed.
     """
 
-    def __init__(self, time: datetime, distance: float, velocity: float, _designation: str, neo: NearEarthObject = None, **info):
+    __slots__ = ('_designation', '_time', 'distance', 'velocity', 'neo')
+
+    def __init__(self, time: datetime, distance: float, velocity: float, _designation: str, neo: NearEarthObject = None):
         """Create a new `CloseApproach`.
 
-        :param time:        The time of the close approach
+        :param time:        The time of the close approach, as a NASA calendar date string or a datetime
         :param distance:    The distance in AU of the approach from earth
         :param velocity:    The speed at which the NEO passed in km/s
         :param neo:         A NEO that made a close approach
-        :param info:        A dictionary of excess keyword arguments supplied to the constructor.
         """
-        self._designation = str(_designation)
-        self.time = cd_to_datetime(time)
+        # an NEO can have many approaches, so intern the designation to store each distinct one only once
+        self._designation = sys.intern(str(_designation))
+        self._time = time  # parsed lazily by the `time` property
         self.distance = float(distance)
         self.velocity = float(velocity)
 
         # Create an attribute for the referenced NEO, originally None.
         self.neo = neo
 
+    @property
+    def time(self):
+        """Return the approach time as a `datetime`, converting it from the calendar date on first access."""
+        if isinstance(self._time, str):
+            self._time = cd_to_datetime(self._time)
+        return self._time
+
     @property
     def time_str(self):
         """Return a formatted representation of this `CloseApproach`'s approach time.
@@ -143,3 +164,7 @@ class CloseApproach:
             "datetime_utc": datetime_to_str(self.time),
             "distance_au": self.distance,
             "velocity_km_s": self.velocity}
+
+    def serialize_full(self):
+        """Return serialised representation, with the associated NEO's nested under the 'neo' key."""
+        return {**self.serialize(), "neo": self.neo.serialize()}
@@ -10,13 +10,20 @@ To run these tests from the project root, run:
 
 These tests should pass when Task 2 is complete.
 """
+import builtins
 import collections.abc
 import datetime
+import json
+import os
 import pathlib
 import math
+import shutil
+import tempfile
 import unittest
+import unittest.mock
 
 from extract import load_neos, load_approaches
+from helpers import cd_to_datetime
 from models import NearEarthObject, CloseApproach
 
 
@@ -118,5 +125,102 @@ class TestLoadApproaches(unittest.TestCase):
         self.assertIsInstance(approach.velocity, float)
 
 
+class TestNearEarthObjectApproaches(unittest.TestCase):
+    def test_neos_without_approaches_do_not_share_a_list(self):
+        first = NearEarthObject('433', 'Eros', '16.84', 'N')
+        second = NearEarthObject('2101', 'Adonis', '0.6', 'Y')
+
+        self.assertEqual(first.approaches, [])
+        self.assertIsNot(first.approaches, second.approaches)
+        first.approaches.append(None)
+        self.assertEqual(second.approaches, [])
+
+
+class TestCloseApproachTime(unittest.TestCase):
+    def test_time_is_converted_on_first_access_and_cached(self):
+        with unittest.mock.patch('models.cd_to_datetime', wraps=cd_to_datetime) as convert:
+            approach = CloseApproach('2020-Jan-01 00:54', '0.02', '5.62', '2020 AY1')
+            convert.assert_not_called()
+
+            first = approach.time
+            second = approach.time
+
+        convert.assert_called_once_with('2020-Jan-01 00:54')
+        self.assertEqual(first, datetime.datetime(2020, 1, 1, 0, 54))
+        self.assertIs(first, second)
+
+    def test_datetime_time_is_kept_as_is(self):
+        time = datetime.datetime(2020, 1, 1, 0, 54)
+        with unittest.mock.patch('models.cd_to_datetime') as convert:
+            approach = CloseApproach(time, '0.02', '5.62', '2020 AY1')
+            self.assertIs(approach.time, time)
+        convert.assert_not_called()
+
+
+class TestLoadApproachesCache(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        self.cad_file = pathlib.Path(self.tempdir.name) / 'cad.json'
+        self.cache_file = pathlib.Path(f"{self.cad_file}.cache")
+        shutil.copy(TEST_CAD_FILE, self.cad_file)
+
+    def test_cache_is_not_written_by_default(self):
+        load_approaches(self.cad_file)
+        self.assertFalse(self.cache_file.exists())
+
+    def test_cache_hit_skips_parsing(self):
+        first = load_approaches(self.cad_file, cache=True)
+        self.assertTrue(self.cache_file.exists())
+
+        with unittest.mock.patch('extract._extract_approach_records', side_effect=AssertionError("parsed again")):
+            second = load_approaches(self.cad_file, cache=True)
+
+        self.assertEqual(len(second), 4700)
+        self.assertEqual([str(approach) for approach in first], [str(approach) for approach in second])
+
+    def test_cache_is_ignored_when_source_replaced_by_older_file(self):
+        load_approaches(self.cad_file, cache=True)
+
+        with open(TEST_CAD_FILE) as f:
+            contents = json.load(f)
+        contents['data'] = contents['data'][:5]
+        with open(self.cad_file, 'w') as f:
+            json.dump(contents, f)
+        older = os.stat(self.cache_file).st_mtime - 100
+        os.utime(self.cad_file, (older, older))
+
+        self.assertEqual(len(load_approaches(self.cad_file, cache=True)), 5)
+
+    def test_corrupt_cache_is_ignored(self):
+        load_approaches(self.cad_file, cache=True)
+        with open(self.cache_file) as f:
+            source = json.load(f)['source']
+
+        for corrupt in (b'\x80\x05garbage', b'{"source": [1, 2', b'[]',
+                        json.dumps({'source': source, 'columns': [['1'], ['2']]}).encode(),
+                        json.dumps({'source': source, 'columns': [['a'], ['1'], ['2'], []]}).encode()):
+            with self.subTest(corrupt=corrupt):
+                with open(self.cache_file, 'wb') as f:
+                    f.write(corrupt)
+                approaches = load_approaches(self.cad_file, cache=True)
+                self.assertEqual(len(approaches), 4700)
+                self.assertIsInstance(approaches[0].time, datetime.datetime)
+
+    def test_unwritable_cache_is_not_an_error(self):
+        real_open = builtins.open
+
+        def read_only_open(file, mode='r', *args, **kwargs):
+            if 'w' in mode:
+                raise PermissionError(f"Read-only directory: {file}")
+            return real_open(file, mode, *args, **kwargs)
+
+        with unittest.mock.patch('extract.open', side_effect=read_only_open, create=True):
+            approaches = load_approaches(self.cad_file, cache=True)
+
+        self.assertEqual(len(approaches), 4700)
+        self.assertFalse(self.cache_file.exists())
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -10,8 +10,14 @@ extension determines which of these functions is used.
 
 You'll edit this file in Part 4.
 """
-import csv
 import json
+import math
+from operator import attrgetter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def write_to_csv(results, filename):
@@ -29,19 +35,27 @@ def write_to_csv(results, filename):
         'designation', 'name', 'diameter_km', 'potentially_hazardous'
     )
     with open(filename, 'w', newline='') as outfile:
-        writer = csv.writer(outfile, quoting=csv.QUOTE_NONNUMERIC)
+        # the schema is fixed, so format rows directly rather than have the csv module inspect every cell - the
+        # output matches csv.QUOTE_NONNUMERIC: non-numeric values quoted, None as "" and csv's \r\n terminator
         # first write a header row
-        writer.writerow(fieldnames)
-        for ca in results:
-            writer.writerow(
-                [
-                    ca.time,
-                    ca.distance,
-                    ca.velocity,
-                    ca._designation,
-                    ca.neo.name,
-                    ca.neo.diameter,
-                    ca.neo.hazardous])
+        outfile.write(','.join(map(_quote, fieldnames)) + '\r\n')
+        # fetch every column of a row in one call
+        columns = attrgetter('time', 'distance', 'velocity', '_designation', 'neo.name', 'neo.diameter', 'neo.hazardous')
+        outfile.writelines(
+            f'"{time}",{distance!r},{velocity!r},{_quote(designation)},{_quote(name)},{diameter!r},'
+            f'{_quote(None) if hazardous is None else hazardous}\r\n'
+            for time, distance, velocity, designation, name, diameter, hazardous in map(columns, results))
+
+
+def _quote(value):
+    """Quote a string value for CSV output, doubling any embedded quotes.
+
+    :param value: A string, or None.
+    :return: The quoted value, with None as an empty (quoted) string.
+    """
+    if value is None:
+        return '""'
+    return '"' + value.replace('"', '""') + '"'
 
 
 def write_to_json(results, filename):
@@ -55,10 +69,34 @@ def write_to_json(results, filename):
     :param results: An iterable of `CloseApproach` objects.
     :param filename: A Path-like object pointing to where the data should be saved.
     """
-    result_list = []
-    for ca in results:
-        formatted_result = ca.serialize()
-        formatted_result.update({"neo": ca.neo.serialize()})
-        result_list.append(formatted_result)
-    with open(filename, 'w') as outfile:
-        json.dump(result_list, outfile, indent=2)
+    with open(filename, 'w', encoding='utf-8') as outfile:
+        # write one record at a time, rather than building the whole list in memory first
+        outfile.write('[')
+        first = True
+        for ca in results:
+            outfile.write('\n  ' if first else ',\n  ')
+            outfile.write(_dumps_record(ca.serialize_full()))
+            first = False
+        outfile.write(']' if first else '\n]')
+
+
+def _dumps_record(record):
+    """Serialise a single JSON output record, indented to sit inside the top-level list.
+
+    orjson serialises much faster, and is used for every record if it's installed, so that a file never mixes the
+    two libraries' output. orjson writes NaN as null, though, so a missing diameter is serialised as null and then
+    swapped for NaN - the key can't be matched inside a string value, whose quotes are escaped. Without orjson,
+    json writes non-ASCII characters as-is too, to match orjson's UTF-8 output.
+
+    :param record: A dictionary representing a `CloseApproach` and its NEO.
+    :return: The record as an indented JSON string.
+    """
+    if not orjson:
+        text = json.dumps(record, indent=2, ensure_ascii=False)
+    elif math.isnan(record["neo"]["diameter_km"]):
+        record = dict(record, neo=dict(record["neo"], diameter_km=None))
+        text = orjson.dumps(record, option=orjson.OPT_INDENT_2).decode()
+        text = text.replace('"diameter_km": null', '"diameter_km": NaN', 1)
+    else:
+        text = orjson.dumps(record, option=orjson.OPT_INDENT_2).decode()
+    return text.replace('\n', '\n  ')